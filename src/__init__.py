@@ -4,3 +4,9 @@ A production-ready pipeline for plant disease detection dataset preparation.
 """
 
 __version__ = "1.0.0"
+
+import pandas as pd
+
+# Copy-on-Write: filtered frames and shallow copies share data until one side
+# is modified, so the pipelines never need defensive .copy() calls
+pd.options.mode.copy_on_write = True
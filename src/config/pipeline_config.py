@@ -4,11 +4,28 @@ Centralized configuration for all data pipelines.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 from dotenv import load_dotenv
 
 
+@lru_cache(maxsize=128)
+def _resolve_path(project_root: Path, path_str: str) -> Path:
+    """
+    Resolve a configured path against the project root (memoized).
+
+    Args:
+        project_root: Root directory of the project
+        path_str: Absolute or project-relative path string
+
+    Returns:
+        Absolute Path object
+    """
+    path = Path(path_str)
+    return path.resolve() if path.is_absolute() else (project_root / path).resolve()
+
+
 class PipelineConfig:
     """Central configuration for all pipelines."""
 
@@ -48,6 +65,16 @@ class PipelineConfig:
         self.species_output_dir = self.output_base_dir / 'species'
         self.disease_output_dir = self.output_base_dir / 'diseases'
 
+        # How exported images are placed: 'copy', 'hardlink' or 'symlink'
+        self.image_link_mode = 'copy'
+
+        # Output paths are fixed once the directories are known, build them once
+        self._output_paths = {
+            'binary': self._build_output_paths(self.binary_output_dir),
+            'species': self._build_output_paths(self.species_output_dir),
+            'disease': self._build_output_paths(self.disease_output_dir)
+        }
+
         # Disease filtering settings
         self.rare_disease_threshold = 0.001  # 0.1%
         self.excluded_diseases = ['Blight', 'Mold', 'Spot', 'Black Rot', 'Gray Spot']
@@ -65,8 +92,7 @@ class PipelineConfig:
         if not path_str:
             raise ValueError("Path string is empty")
 
-        path = Path(path_str)
-        return path.resolve() if path.is_absolute() else (self.project_root / path).resolve()
+        return _resolve_path(self.project_root, path_str)
 
     def get_output_paths(self, pipeline_type: str) -> dict:
         """
@@ -78,15 +104,22 @@ class PipelineConfig:
         Returns:
             Dictionary with output paths
         """
-        if pipeline_type == 'binary':
-            base_dir = self.binary_output_dir
-        elif pipeline_type == 'species':
-            base_dir = self.species_output_dir
-        elif pipeline_type == 'disease':
-            base_dir = self.disease_output_dir
-        else:
+        if pipeline_type not in self._output_paths:
             raise ValueError(f"Unknown pipeline type: {pipeline_type}")
 
+        return dict(self._output_paths[pipeline_type])
+
+    @staticmethod
+    def _build_output_paths(base_dir: Path) -> dict:
+        """
+        Build the output directory layout under a base directory.
+
+        Args:
+            base_dir: Base output directory of a pipeline
+
+        Returns:
+            Dictionary with output paths
+        """
         return {
             'base_dir': base_dir,
             'images_train': base_dir / 'images' / 'train',
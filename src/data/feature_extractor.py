@@ -3,9 +3,55 @@ Feature Extractor
 Extracts species and disease information from class labels.
 """
 
+import logging
 import re
 import pandas as pd
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _trie_to_pattern(node: Dict[str, dict]) -> str:
+    """
+    Render a character trie as a regex where shared prefixes appear only once.
+
+    Args:
+        node: Trie node mapping characters to child nodes ('' marks a word end)
+
+    Returns:
+        Regex pattern matching every word stored below this node
+    """
+    branches = [re.escape(char) + _trie_to_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        pattern = f'(?:{pattern})?'
+    return pattern
+
+
+def _build_alternation(words: List[str]) -> str:
+    """
+    Build a trie-structured alternation over words.
+
+    A flat 'a|b|c' alternation makes the regex engine retry every word at each
+    position; factoring common prefixes lets it rule out whole branches after
+    a single character.
+
+    Args:
+        words: Words to match (lowercased, so compile with re.IGNORECASE)
+
+    Returns:
+        Regex pattern (without groups or anchors) matching any of the words
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return _trie_to_pattern(trie)
 
 
 class FeatureExtractor:
@@ -20,6 +66,13 @@ class FeatureExtractor:
         """
         self.plant_species = plant_species
 
+        # Map lowercase matches back to the configured spelling
+        self._species_lookup = {plant.lower(): plant for plant in plant_species if plant}
+
+        # Trie-structured alternation compiled once for all species
+        alternation = _build_alternation(list(self._species_lookup)) or '(?!)'
+        self._species_re = re.compile(rf"\b({alternation})\b", flags=re.IGNORECASE)
+
     def extract_species(self, text: str) -> Optional[str]:
         """
         Extract plant species from text.
@@ -30,10 +83,8 @@ class FeatureExtractor:
         Returns:
             Species name or None if not found
         """
-        for plant in self.plant_species:
-            if re.search(rf"\b{plant}\b", text, flags=re.IGNORECASE):
-                return plant
-        return None
+        match = self._species_re.search(text)
+        return self._species_lookup[match.group(1).lower()] if match else None
 
     def extract_disease(self, text: str) -> str:
         """
@@ -45,27 +96,36 @@ class FeatureExtractor:
         Returns:
             Disease name or "healthy" if no disease
         """
-        for plant in self.plant_species:
-            text = re.sub(rf"\b{plant}\b", "", text, flags=re.IGNORECASE).strip()
+        text = self._species_re.sub("", text).strip()
 
         # Normalize to title case to avoid duplicates
         return text.title() if text else "healthy"
 
-    def add_features(self, df: pd.DataFrame, dataset_type: str) -> pd.DataFrame:
+    def add_features(self, df: pd.DataFrame, dataset_type: str, inplace: bool = False) -> pd.DataFrame:
         """
         Add 'species' and 'disease' columns to DataFrame.
 
         Args:
             df: DataFrame with 'class' column
             dataset_type: 'train' or 'test'
+            inplace: If True, modify df directly instead of working on a copy
 
         Returns:
             DataFrame with added 'species' and 'disease' columns
         """
-        df = df.copy()
-        df['species'] = df['class'].apply(self.extract_species)
-        df['disease'] = df['class'].apply(self.extract_disease)
+        if not inplace:
+            df = df.copy()
+        df['species'] = (
+            df['class']
+            .str.extract(self._species_re, expand=False)
+            .str.lower()
+            .map(self._species_lookup)
+        )
+
+        # Normalize to title case to avoid duplicates
+        disease = df['class'].str.replace(self._species_re, '', regex=True).str.strip().str.title()
+        df['disease'] = disease.mask(disease == '', 'healthy')
 
-        print(f"✓ Features extracted for the {dataset_type} dataset (species, disease)")
+        logger.info(f"✓ Features extracted for the {dataset_type} dataset (species, disease)")
 
         return df
@@ -4,57 +4,78 @@ Run all three pipelines from A to Z.
 """
 
 import argparse
+import logging
 from pathlib import Path
+from typing import Optional
 
 from .config import PipelineConfig
 from .pipelines import BinaryPipeline, SpeciesPipeline, DiseasePipeline
 
+logger = logging.getLogger(__name__)
 
-def run_all_pipelines(config: PipelineConfig):
+
+def _balance_options(interactive: bool, target_samples: Optional[int]) -> dict:
+    """Build the balancing arguments passed to BasePipeline.run."""
+    return {
+        'interactive': interactive,
+        'target_samples': target_samples,
+        'apply_balancing': target_samples is not None
+    }
+
+
+def run_all_pipelines(config: PipelineConfig, interactive: bool = True,
+                      target_samples: Optional[int] = None):
     """
     Run all three pipelines in sequence.
 
     Args:
         config: Pipeline configuration
+        interactive: If True, ask how to balance each training set
+        target_samples: Target samples per class for non-interactive balancing
+            (None keeps the natural distribution)
     """
-    print("\n" + "="*80)
-    print(" "*20 + "PLANTDOC DATASET PIPELINE")
-    print("="*80)
+    logger.info("\n" + "="*80)
+    logger.info(" "*20 + "PLANTDOC DATASET PIPELINE")
+    logger.info("="*80)
 
     # Pipeline 1: Binary Classification (Healthy vs Disease)
-    print("\n[1/3] Running Binary Pipeline...")
+    logger.info("\n[1/3] Running Binary Pipeline...")
     binary_pipeline = BinaryPipeline(config)
-    binary_pipeline.run()
+    binary_pipeline.run(**_balance_options(interactive, target_samples))
 
     # Pipeline 2: Species Classification
-    print("\n[2/3] Running Species Pipeline...")
+    logger.info("\n[2/3] Running Species Pipeline...")
     species_pipeline = SpeciesPipeline(config)
-    species_pipeline.run()
+    species_pipeline.run(**_balance_options(interactive, target_samples))
 
     # Pipeline 3: Disease Classification
-    print("\n[3/3] Running Disease Pipeline...")
+    logger.info("\n[3/3] Running Disease Pipeline...")
     disease_pipeline = DiseasePipeline(config)
-    disease_pipeline.run()
+    disease_pipeline.run(**_balance_options(interactive, target_samples))
 
     # Summary
-    print("\n" + "="*80)
-    print(" "*20 + "ALL PIPELINES COMPLETE!")
-    print("="*80)
-    print("\nGenerated datasets:")
-    print(f"  1. Binary:  {config.binary_output_dir}")
-    print(f"  2. Species: {config.species_output_dir}")
-    print(f"  3. Disease: {config.disease_output_dir}")
-    print("\nYou can now train YOLO models using the dataset.yaml files in each directory.")
-    print("="*80 + "\n")
-
-
-def run_single_pipeline(pipeline_type: str, config: PipelineConfig):
+    logger.info("\n" + "="*80)
+    logger.info(" "*20 + "ALL PIPELINES COMPLETE!")
+    logger.info("="*80)
+    logger.info("\nGenerated datasets:")
+    logger.info(f"  1. Binary:  {config.binary_output_dir}")
+    logger.info(f"  2. Species: {config.species_output_dir}")
+    logger.info(f"  3. Disease: {config.disease_output_dir}")
+    logger.info("\nYou can now train YOLO models using the dataset.yaml files in each directory.")
+    logger.info("="*80 + "\n")
+
+
+def run_single_pipeline(pipeline_type: str, config: PipelineConfig, interactive: bool = True,
+                        target_samples: Optional[int] = None):
     """
     Run a single pipeline.
 
     Args:
         pipeline_type: Type of pipeline ('binary', 'species', or 'disease')
         config: Pipeline configuration
+        interactive: If True, ask how to balance the training set
+        target_samples: Target samples per class for non-interactive balancing
+            (None keeps the natural distribution)
     """
     if pipeline_type == 'binary':
         pipeline = BinaryPipeline(config)
@@ -65,7 +86,7 @@ def run_single_pipeline(pipeline_type: str, config: PipelineConfig):
     else:
         raise ValueError(f"Unknown pipeline type: {pipeline_type}")
 
-    pipeline.run()
+    pipeline.run(**_balance_options(interactive, target_samples))
 
 
 def main():
@@ -86,6 +107,9 @@ Examples:
 
   # Run only disease pipeline
   python -m src.main --pipeline disease
+
+  # Run without prompts, balancing to 500 samples per class
+  python -m src.main --all --target-samples 500
         """
     )
 
@@ -108,20 +132,51 @@ Examples:
         help='Path to custom .env file (optional)'
     )
 
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only show warnings and errors'
+    )
+
+    parser.add_argument(
+        '--non-interactive',
+        action='store_true',
+        help='Do not prompt for balancing (keeps the natural distribution unless --target-samples is set)'
+    )
+
+    parser.add_argument(
+        '--target-samples',
+        type=int,
+        help='Balance training sets to this many samples per class without prompting'
+    )
+
     args = parser.parse_args()
 
+    # Configure logging once for the whole run
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format='%(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+
     # Validate arguments
     if not args.all and not args.pipeline:
         parser.error("You must specify either --all or --pipeline")
 
+    if args.target_samples is not None and args.target_samples <= 0:
+        parser.error("--target-samples must be a positive number")
+
+    # A given target implies a batch run
+    interactive = not args.non_interactive and args.target_samples is None
+
     # Load configuration
     config = PipelineConfig()
 
     # Run pipelines
     if args.all:
-        run_all_pipelines(config)
+        run_all_pipelines(config, interactive, args.target_samples)
     else:
-        run_single_pipeline(args.pipeline, config)
+        run_single_pipeline(args.pipeline, config, interactive, args.target_samples)
 
 
 if __name__ == '__main__':
@@ -3,15 +3,19 @@ Base Pipeline
 Abstract base class for all data processing pipelines.
 """
 
+import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from ..config import PipelineConfig
 from ..data import DataLoader, DataValidator, FeatureExtractor
 from ..processing import DataBalancer, YOLOConverter
 
+logger = logging.getLogger(__name__)
+
 
 class BasePipeline(ABC):
     """Abstract base class for all pipelines."""
@@ -36,35 +40,56 @@ class BasePipeline(ABC):
         self.df_train_processed: pd.DataFrame = None
         self.df_test_processed: pd.DataFrame = None
 
+        # Class counts of df_train, computed in filter_data and reused when balancing
+        self.train_distribution: pd.Series = None
+
     def load_and_prepare_data(self):
         """Load, clean, extract features, and validate data."""
-        print(f"\n{'='*60}")
-        print(f"LOADING AND PREPARING DATA")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"LOADING AND PREPARING DATA")
+        logger.info(f"{'='*60}\n")
 
-        # Load and clean
+        # Load and clean (fresh data invalidates any cached class counts)
+        self.train_distribution = None
         self.df_train, self.df_test = self.data_loader.load_and_clean(
             self.config.train_labels_csv,
             self.config.test_labels_csv
         )
 
-        # Extract features
-        self.df_train = self.feature_extractor.add_features(self.df_train, "train")
-        self.df_test = self.feature_extractor.add_features(self.df_test, "test")
-
-        # Validate
-        self.df_train = self.data_validator.validate_and_fix(
-            self.df_train,
-            self.config.train_images_dir,
-            "train"
-        )
-        self.df_test = self.data_validator.validate_and_fix(
-            self.df_test,
-            self.config.test_images_dir,
-            "test"
-        )
-
-        print(f"\n✓ Data preparation complete")
+        # Extract features (the pipeline owns these frames, skip defensive copies)
+        self.df_train = self.feature_extractor.add_features(self.df_train, "train", inplace=True)
+        self.df_test = self.feature_extractor.add_features(self.df_test, "test", inplace=True)
+
+        # Validate (train and test touch disjoint folders, run them concurrently)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_train = executor.submit(
+                self.data_validator.validate_and_fix,
+                self.df_train,
+                self.config.train_images_dir,
+                "train",
+                inplace=True
+            )
+            future_test = executor.submit(
+                self.data_validator.validate_and_fix,
+                self.df_test,
+                self.config.test_images_dir,
+                "test",
+                inplace=True
+            )
+            self.df_train = future_train.result()
+            self.df_test = future_test.result()
+
+        # Label columns as categoricals: value_counts, isin and groupby then
+        # work on integer codes instead of rescanning strings
+        for df in (self.df_train, self.df_test):
+            for column in ('species', 'disease'):
+                df[column] = df[column].astype('category')
+
+            # Filenames in one contiguous Arrow buffer instead of one Python
+            # object each, for the balancer's renames and the export's grouping
+            df['filename'] = df['filename'].astype('string[pyarrow]')
+
+        logger.info(f"\n✓ Data preparation complete")
 
     @abstractmethod
     def filter_data(self):
@@ -75,10 +100,20 @@ class BasePipeline(ABC):
         pass
 
     @abstractmethod
-    def balance_data(self):
+    def balance_data(
+        self,
+        interactive: bool = True,
+        target_samples: Optional[int] = None,
+        apply_balancing: bool = False
+    ):
         """
         Balance data for training.
         Must be implemented by subclasses.
+
+        Args:
+            interactive: If True, ask the user; otherwise use the arguments below
+            target_samples: Target samples per class when balancing non-interactively
+            apply_balancing: Whether to balance when running non-interactively
         """
         pass
 
@@ -104,6 +139,91 @@ class BasePipeline(ABC):
         """
         pass
 
+    def get_train_distribution(self) -> pd.Series:
+        """
+        Get the class distribution of the training data.
+
+        Returns:
+            Series with class counts, sorted by class
+        """
+        if self.train_distribution is None:
+            self.train_distribution = self.balancer.get_class_distribution(
+                self.df_train,
+                self.get_class_column()
+            )
+        return self.train_distribution
+
+    def _ask_balance_target(self, max_possible: int) -> Optional[int]:
+        """
+        Ask the user whether to balance the training set, and to which target.
+
+        Args:
+            max_possible: Largest target the minority class supports
+
+        Returns:
+            Target samples per class, or None to keep the natural distribution
+        """
+        print(f"\n{'-'*60}")
+        print("BALANCING OPTIONS")
+        print(f"{'-'*60}")
+        print("Do you want to balance the training dataset?")
+        print("  1. Yes, with custom target")
+        print("  2. No, keep natural distribution")
+
+        while True:
+            choice = input("\nMake a choice between 1 and 2: ").strip()
+
+            if choice == "1":
+                while True:
+                    try:
+                        target_samples = int(input("Enter target samples per class: "))
+                        if target_samples > max_possible:
+                            print(f"⚠️  Warning: Maximum possible is {max_possible} (minority class size)")
+                            print(f"   Using undersampling will limit to {max_possible} per class")
+                            confirm = input(f"Continue with {target_samples}? (y/n): ").strip().lower()
+                            if confirm == 'y':
+                                return target_samples
+                        elif target_samples > 0:
+                            return target_samples
+                        else:
+                            print("⚠️  Please enter a positive number")
+                    except ValueError:
+                        print("⚠️  Please enter a valid number")
+            elif choice == '2':
+                return None
+            else:
+                print("⚠️  Please enter a valid choice between 1 and 2")
+
+    def _resolve_balance_target(
+        self,
+        interactive: bool,
+        target_samples: Optional[int],
+        apply_balancing: bool,
+        max_possible_factor: int = 2
+    ) -> Optional[int]:
+        """
+        Decide the balancing target, prompting only in interactive mode.
+
+        Args:
+            interactive: If True, ask the user
+            target_samples: Target samples per class for non-interactive runs
+            apply_balancing: Whether to balance in non-interactive runs
+            max_possible_factor: Multiple of the minority class size offered as maximum
+
+        Returns:
+            Target samples per class, or None to keep the natural distribution
+        """
+        if interactive:
+            # The distribution is only needed to bound the prompt
+            distribution = self.get_train_distribution()
+            return self._ask_balance_target(distribution.min() * max_possible_factor)
+
+        if not apply_balancing:
+            return None
+        if target_samples is None or target_samples <= 0:
+            raise ValueError("A positive target_samples is required to balance non-interactively")
+        return target_samples
+
     def create_class_mapping(self) -> Dict[str, int]:
         """
         Create class-to-index mapping.
@@ -119,9 +239,9 @@ class BasePipeline(ABC):
 
     def export_data(self):
         """Export processed data to YOLO format."""
-        print(f"\n{'='*60}")
-        print(f"EXPORTING TO YOLO FORMAT")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"EXPORTING TO YOLO FORMAT")
+        logger.info(f"{'='*60}\n")
 
         # Get output paths
         output_paths = self.config.get_output_paths(self.get_pipeline_type())
@@ -131,28 +251,30 @@ class BasePipeline(ABC):
         class_mapping = self.create_class_mapping()
 
         # Export training data
-        print(f"\nExporting TRAINING data...")
+        logger.info(f"\nExporting TRAINING data...")
         exported_train, skipped_train = self.yolo_converter.export_to_yolo(
             df=self.df_train_processed,
             source_images_dir=self.config.train_images_dir,
             output_images_dir=output_paths['images_train'],
             output_labels_dir=output_paths['labels_train'],
             class_mapping=class_mapping,
-            class_column=class_column
+            class_column=class_column,
+            link_mode=self.config.image_link_mode
         )
-        print(f"✓ Exported: {exported_train} images, Skipped: {skipped_train}")
+        logger.info(f"✓ Exported: {exported_train} images, Skipped: {skipped_train}")
 
         # Export validation data
-        print(f"\nExporting VALIDATION data...")
+        logger.info(f"\nExporting VALIDATION data...")
         exported_val, skipped_val = self.yolo_converter.export_to_yolo(
             df=self.df_test_processed,
             source_images_dir=self.config.test_images_dir,
             output_images_dir=output_paths['images_val'],
             output_labels_dir=output_paths['labels_val'],
             class_mapping=class_mapping,
-            class_column=class_column
+            class_column=class_column,
+            link_mode=self.config.image_link_mode
         )
-        print(f"✓ Exported: {exported_val} images, Skipped: {skipped_val}")
+        logger.info(f"✓ Exported: {exported_val} images, Skipped: {skipped_val}")
 
         # Create YAML config
         yaml_path = self.yolo_converter.create_yaml_config(
@@ -160,22 +282,32 @@ class BasePipeline(ABC):
             class_mapping=class_mapping
         )
 
-        print(f"\n{'='*60}")
-        print(f"EXPORT COMPLETE")
-        print(f"{'='*60}")
-        print(f"Training: {exported_train} images")
-        print(f"Validation: {exported_val} images")
-        print(f"Config: {yaml_path}")
-        print(f"{'='*60}\n")
-
-    def run(self):
+        logger.info(f"\n{'='*60}")
+        logger.info(f"EXPORT COMPLETE")
+        logger.info(f"{'='*60}")
+        logger.info(f"Training: {exported_train} images")
+        logger.info(f"Validation: {exported_val} images")
+        logger.info(f"Config: {yaml_path}")
+        logger.info(f"{'='*60}\n")
+
+    def run(
+        self,
+        interactive: bool = True,
+        target_samples: Optional[int] = None,
+        apply_balancing: bool = False
+    ):
         """
         Run the complete pipeline from start to finish.
         This is the main entry point for executing a pipeline.
+
+        Args:
+            interactive: If True, ask the user how to balance the training set
+            target_samples: Target samples per class when balancing non-interactively
+            apply_balancing: Whether to balance when running non-interactively
         """
-        print(f"\n{'#'*60}")
-        print(f"RUNNING {self.get_pipeline_type().upper()} PIPELINE")
-        print(f"{'#'*60}\n")
+        logger.info(f"\n{'#'*60}")
+        logger.info(f"RUNNING {self.get_pipeline_type().upper()} PIPELINE")
+        logger.info(f"{'#'*60}\n")
 
         # Step 1: Load and prepare
         self.load_and_prepare_data()
@@ -184,11 +316,15 @@ class BasePipeline(ABC):
         self.filter_data()
 
         # Step 3: Balance (pipeline-specific)
-        self.balance_data()
+        self.balance_data(
+            interactive=interactive,
+            target_samples=target_samples,
+            apply_balancing=apply_balancing
+        )
 
         # Step 4: Export
         self.export_data()
 
-        print(f"\n{'#'*60}")
-        print(f"{self.get_pipeline_type().upper()} PIPELINE COMPLETE")
-        print(f"{'#'*60}\n")
+        logger.info(f"\n{'#'*60}")
+        logger.info(f"{self.get_pipeline_type().upper()} PIPELINE COMPLETE")
+        logger.info(f"{'#'*60}\n")
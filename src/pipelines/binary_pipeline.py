@@ -3,9 +3,13 @@ Binary Pipeline
 Pipeline for binary classification (Healthy vs Disease).
 """
 
+import logging
 import pandas as pd
+from typing import Optional
 from .base_pipeline import BasePipeline
 
+logger = logging.getLogger(__name__)
+
 
 class BinaryPipeline(BasePipeline):
     """Pipeline for binary classification: healthy (0) vs disease (1)."""
@@ -23,87 +27,63 @@ class BinaryPipeline(BasePipeline):
         Create binary labels: 0 = healthy, 1 = disease.
         No filtering needed - we keep all samples.
         """
-        print(f"\n{'='*60}")
-        print(f"CREATING BINARY LABELS")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"CREATING BINARY LABELS")
+        logger.info(f"{'='*60}\n")
 
         # Create binary class column
         self.df_train['binary_class'] = (self.df_train['disease'] != 'healthy').astype(int)
         self.df_test['binary_class'] = (self.df_test['disease'] != 'healthy').astype(int)
 
-        # Show distribution
-        healthy_train = (self.df_train['binary_class'] == 0).sum()
-        disease_train = (self.df_train['binary_class'] == 1).sum()
+        # Show distribution (training counts are kept for balancing)
+        self.train_distribution = self.balancer.get_class_distribution(self.df_train, 'binary_class')
+        healthy_train = self.train_distribution.get(0, 0)
+        disease_train = self.train_distribution.get(1, 0)
 
         healthy_test = (self.df_test['binary_class'] == 0).sum()
         disease_test = (self.df_test['binary_class'] == 1).sum()
 
-        print(f"Training set:")
-        print(f"  Class 0 (Healthy): {healthy_train} samples")
-        print(f"  Class 1 (Disease): {disease_train} samples")
-        print(f"  Ratio: {healthy_train/disease_train:.2f}:1 (Healthy:Disease)")
+        logger.info(f"Training set:")
+        logger.info(f"  Class 0 (Healthy): {healthy_train} samples")
+        logger.info(f"  Class 1 (Disease): {disease_train} samples")
+        logger.info(f"  Ratio: {healthy_train/disease_train:.2f}:1 (Healthy:Disease)")
 
-        print(f"\nValidation set:")
-        print(f"  Class 0 (Healthy): {healthy_test} samples")
-        print(f"  Class 1 (Disease): {disease_test} samples")
+        logger.info(f"\nValidation set:")
+        logger.info(f"  Class 0 (Healthy): {healthy_test} samples")
+        logger.info(f"  Class 1 (Disease): {disease_test} samples")
 
-        print(f"\n✓ Binary labels created")
+        logger.info(f"\n✓ Binary labels created")
 
-    def balance_data(self, interactive: bool = True) -> None:
+    def balance_data(
+        self,
+        interactive: bool = True,
+        target_samples: Optional[int] = None,
+        apply_balancing: bool = False
+    ) -> None:
         """
         Balance the dataset by letting user choose to balance with a specific target or keep the natural balanced
 
         Args:
-            interactive: If True, ask user for target samples. If False, use default.
+            interactive: If True, ask user for target samples. If False, use the arguments below.
+            target_samples: Target samples per class when balancing non-interactively
+            apply_balancing: Whether to balance when running non-interactively
         """
-        print(f"\n{'='*60}")
-        print("PREPARING DATASETS")
-        print(f"{'='*60}\n")
-
-        # Ask user for balancing choice
-
-        distribution = self.df_train['binary_class'].value_counts().sort_index()
-        apply_balancing = False
-
-        if interactive:
-            print(f"\n{'-'*60}")
-            print("BALANCING OPTIONS")
-            print(f"{'-'*60}")
-            print("Do you want to balance the training dataset?")
-            print("  1. Yes, with custom target")
-            print("  2. No, keep natural distribution")
-
-            while True:
-                choice = input("\nMake a choice between 1 and 2: ").strip()
-
-                if choice == "1":
-                    apply_balancing = True
-                    while True:
-                        try:
-                            target_samples = int(input("Enter target samples per class: "))
-                            max_possible = distribution.min()
-                            if target_samples > max_possible:
-                                print(f"⚠️  Warning: Maximum possible is {max_possible} (minority class size)")
-                                print(f"   Using undersampling will limit to {max_possible} per class")
-                                confirm = input(f"Continue with {target_samples}? (y/n): ").strip().lower()
-                                if confirm == 'y':
-                                    break
-                            elif target_samples > 0:
-                                break
-                            else:
-                                print("⚠️  Please enter a positive number")
-                        except ValueError:
-                            print("⚠️  Please enter a valid number")
-                    break
-                elif choice == '2':
-                    apply_balancing = False
-                    break
-                else:
-                    print("⚠️  Please enter a valid choice between 1 and 2")
+        logger.info(f"\n{'='*60}")
+        logger.info("PREPARING DATASETS")
+        logger.info(f"{'='*60}\n")
+
+        # Ask user for balancing choice (batch runs pass the choice directly)
+        target_samples = self._resolve_balance_target(
+            interactive,
+            target_samples,
+            apply_balancing,
+            max_possible_factor=1
+        )
+        apply_balancing = target_samples is not None
 
         # Apply balancing if requested
         if apply_balancing:
-            print(f"\n Balancing training dataset to {target_samples} samples per class...")
+            logger.info(f"\n Balancing training dataset to {target_samples} samples per class...")
             self.df_train_processed = self.balancer.balance_by_column(
                 self.df_train,
                 column='binary_class',
@@ -112,17 +92,18 @@ class BinaryPipeline(BasePipeline):
 
             # Show new distribution
             new_distribution = self.df_train_processed['binary_class'].value_counts().sort_index()
-            print("\n📊 Training set - Balanced distribution:")
+            logger.info("\n📊 Training set - Balanced distribution:")
             for label, count in new_distribution.items():
                 label_name = "Healthy" if label == 0 else "Diseased"
                 percentage = (count / len(self.df_train_processed)) * 100
-                print(f"  {label_name:12} (label {label}): {count:5} samples ({percentage:5.1f}%)")
+                logger.info(f"  {label_name:12} (label {label}): {count:5} samples ({percentage:5.1f}%)")
 
-            print(f"\n  Total training: {len(self.df_train_processed)} samples")
-            print("✓ Training dataset balanced successfully")
+            logger.info(f"\n  Total training: {len(self.df_train_processed)} samples")
+            logger.info("✓ Training dataset balanced successfully")
         else:
-            print("\n✓ Keeping natural distribution (no balancing)")
-            self.df_train_processed = self.df_train.copy()
+            logger.info("\n✓ Keeping natural distribution (no balancing)")
+            # Lazy copy under Copy-on-Write, data is shared until modified
+            self.df_train_processed = self.df_train.copy(deep=False)
 
         # Test set is never balanced
-        self.df_test_processed = self.df_test.copy()
+        self.df_test_processed = self.df_test.copy(deep=False)
@@ -3,9 +3,13 @@ Disease Pipeline
 Pipeline for multi-class disease classification.
 """
 
+import logging
 import pandas as pd
+from typing import Optional
 from .base_pipeline import BasePipeline
 
+logger = logging.getLogger(__name__)
+
 
 class DiseasePipeline(BasePipeline):
     """Pipeline for disease classification (excludes healthy plants)."""
@@ -22,119 +26,97 @@ class DiseasePipeline(BasePipeline):
         """
         Filter out healthy samples and rare/excluded diseases.
         """
-        print(f"\n{'='*60}")
-        print(f"FILTERING DISEASE SAMPLES")
-        print(f"{'='*60}\n")
-
-        # Step 1: Filter out healthy samples
-        df_diseases_train = self.df_train[self.df_train['disease'] != 'healthy'].copy()
-        df_diseases_test = self.df_test[self.df_test['disease'] != 'healthy'].copy()
-
-        print(f"After removing healthy samples:")
-        print(f"  Training: {len(df_diseases_train)} disease samples")
-        print(f"  Validation: {len(df_diseases_test)} disease samples")
-
-        # Step 2: Identify and remove rare diseases
-        disease_proportions = df_diseases_train['disease'].value_counts(normalize=True)
+        logger.info(f"\n{'='*60}")
+        logger.info(f"FILTERING DISEASE SAMPLES")
+        logger.info(f"{'='*60}\n")
+
+        # Step 1: Flag healthy samples (masks only, nothing is copied yet)
+        is_disease_train = self.df_train['disease'] != 'healthy'
+        is_disease_test = self.df_test['disease'] != 'healthy'
+
+        logger.info(f"After removing healthy samples:")
+        logger.info(f"  Training: {int(is_disease_train.sum())} disease samples")
+        logger.info(f"  Validation: {int(is_disease_test.sum())} disease samples")
+
+        # Step 2: Identify rare diseases among the disease samples
+        diseases_train = self.df_train.loc[is_disease_train, 'disease'].cat.remove_unused_categories()
+        # One count pass serves both the proportions and the rare-disease report
+        disease_counts = diseases_train.value_counts()
+        disease_proportions = disease_counts / disease_counts.sum()
         rare_diseases = disease_proportions[
             disease_proportions < self.config.rare_disease_threshold
         ].index.tolist()
 
-        print(f"\nRare diseases (< {self.config.rare_disease_threshold*100}%):")
+        logger.info(f"\nRare diseases (< {self.config.rare_disease_threshold*100}%):")
+        counts_dict = disease_counts.to_dict()
         for disease in rare_diseases:
-            count = len(df_diseases_train[df_diseases_train['disease'] == disease])
-            print(f"  {disease}: {count} samples")
+            logger.info(f"  {disease}: {counts_dict[disease]} samples")
 
         # Step 3: Combine rare and manually excluded diseases
-        all_excluded = list(set(rare_diseases + self.config.excluded_diseases))
+        # Kept as a set so isin() hashes each label once instead of scanning a list
+        all_excluded = set(rare_diseases) | set(self.config.excluded_diseases)
 
-        print(f"\nManually excluded diseases:")
+        logger.info(f"\nManually excluded diseases:")
         for disease in self.config.excluded_diseases:
-            print(f"  {disease}")
+            logger.info(f"  {disease}")
 
-        print(f"\nAll excluded diseases: {all_excluded}")
+        logger.info(f"\nAll excluded diseases: {sorted(all_excluded)}")
 
-        # Step 4: Remove excluded diseases
-        df_diseases_clean_train = df_diseases_train[
-            ~df_diseases_train['disease'].isin(all_excluded)
-        ].copy()
+        # Step 4: Remove healthy and excluded diseases with one combined mask
+        keep_train = is_disease_train & ~self.df_train['disease'].isin(all_excluded)
+        keep_test = is_disease_test & ~self.df_test['disease'].isin(all_excluded)
 
-        df_diseases_clean_test = df_diseases_test[
-            ~df_diseases_test['disease'].isin(all_excluded)
-        ].copy()
+        self.df_train = self.df_train.loc[keep_train].reset_index(drop=True)
+        self.df_test = self.df_test.loc[keep_test].reset_index(drop=True)
 
-        print(f"\nAfter removing rare and excluded diseases:")
-        print(f"  Training: {len(df_diseases_clean_train)} samples")
-        print(f"  Validation: {len(df_diseases_clean_test)} samples")
+        # Filtered-out diseases leave empty categories behind
+        self.df_train['disease'] = self.df_train['disease'].cat.remove_unused_categories()
+        self.df_test['disease'] = self.df_test['disease'].cat.remove_unused_categories()
 
-        # Update dataframes
-        self.df_train = df_diseases_clean_train
-        self.df_test = df_diseases_clean_test
+        logger.info(f"\nAfter removing rare and excluded diseases:")
+        logger.info(f"  Training: {len(self.df_train)} samples")
+        logger.info(f"  Validation: {len(self.df_test)} samples")
 
-        # Show disease distribution
+        # Show disease distribution (counts are kept for balancing)
+        self.train_distribution = self.balancer.get_class_distribution(self.df_train, 'disease')
         self.balancer.print_distribution(
             self.df_train,
             'disease',
-            "Training disease distribution (before balancing)"
+            "Training disease distribution (before balancing)",
+            counts=self.train_distribution
         )
 
-        print(f"\n✓ Filtering complete")
+        logger.info(f"\n✓ Filtering complete")
 
-    def balance_data(self, interactive: bool = True) -> None:
+    def balance_data(
+        self,
+        interactive: bool = True,
+        target_samples: Optional[int] = None,
+        apply_balancing: bool = False
+    ) -> None:
         """
         Balance the dataset by letting user choose to balance with a specific target or keep the natural balanced
 
         Args:
-            interactive: If True, ask user for target samples. If False, use default.
+            interactive: If True, ask user for target samples. If False, use the arguments below.
+            target_samples: Target samples per class when balancing non-interactively
+            apply_balancing: Whether to balance when running non-interactively
         """
-        print(f"\n{'='*60}")
-        print("PREPARING DATASETS")
-        print(f"{'='*60}\n")
-
-        # Ask user for balancing choice
-
-        distribution = self.df_train['disease'].value_counts().sort_index()
-        apply_balancing = False
-
-        if interactive:
-            print(f"\n{'-'*60}")
-            print("BALANCING OPTIONS")
-            print(f"{'-'*60}")
-            print("Do you want to balance the training dataset?")
-            print("  1. Yes, with custom target")
-            print("  2. No, keep natural distribution")
-
-            while True:
-                choice = input("\nMake a choice between 1 and 2: ").strip()
-
-                if choice == "1":
-                    apply_balancing = True
-                    while True:
-                        try:
-                            target_samples = int(input("Enter target samples per class: "))
-                            max_possible = distribution.min() * 2
-                            if target_samples > max_possible:
-                                print(f"⚠️  Warning: Maximum possible is {max_possible} (minority class size)")
-                                print(f"   Using undersampling will limit to {max_possible} per class")
-                                confirm = input(f"Continue with {target_samples}? (y/n): ").strip().lower()
-                                if confirm == 'y':
-                                    break
-                            elif target_samples > 0:
-                                break
-                            else:
-                                print("⚠️  Please enter a positive number")
-                        except ValueError:
-                            print("⚠️  Please enter a valid number")
-                    break
-                elif choice == '2':
-                    apply_balancing = False
-                    break
-                else:
-                    print("⚠️  Please enter a valid choice between 1 and 2")
+        logger.info(f"\n{'='*60}")
+        logger.info("PREPARING DATASETS")
+        logger.info(f"{'='*60}\n")
+
+        # Ask user for balancing choice (batch runs pass the choice directly)
+        target_samples = self._resolve_balance_target(
+            interactive,
+            target_samples,
+            apply_balancing
+        )
+        apply_balancing = target_samples is not None
 
         # Apply balancing if requested
         if apply_balancing:
-            print(f"\n Balancing training dataset to {target_samples} samples per class...")
+            logger.info(f"\n Balancing training dataset to {target_samples} samples per class...")
             self.df_train_processed = self.balancer.balance_by_column(
                 self.df_train,
                 column='disease',
@@ -146,10 +128,11 @@ class DiseasePipeline(BasePipeline):
             'disease',
             "Training disease distribution (after balancing)"
             )
-            print("✓ Training dataset balanced successfully")
+            logger.info("✓ Training dataset balanced successfully")
         else:
-            print("\n✓ Keeping natural distribution (no balancing)")
-            self.df_train_processed = self.df_train.copy()
+            logger.info("\n✓ Keeping natural distribution (no balancing)")
+            # Lazy copy under Copy-on-Write, data is shared until modified
+            self.df_train_processed = self.df_train.copy(deep=False)
 
         # Test set is never balanced
-        self.df_test_processed = self.df_test.copy()
+        self.df_test_processed = self.df_test.copy(deep=False)
@@ -3,10 +3,13 @@ Data Balancer
 Balances dataset classes through duplication.
 """
 
+import logging
+import numpy as np
 import pandas as pd
-from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 class DataBalancer:
     """Balances dataset by duplicating samples from underrepresented classes."""
@@ -35,50 +38,66 @@ class DataBalancer:
                              If False, downsample to target.
 
         Returns:
-            Balanced DataFrame
+            Balanced DataFrame, with an 'orig_filename' column naming the source
+            image of every row (duplicates get a new 'filename')
         """
-        balanced_dfs = []
-
-        for class_value, group in df.groupby(column):
-            n_samples = len(group)
-            n_to_add = target_samples_per_class - n_samples
+        # Integer class codes (sorted like groupby, missing labels get -1)
+        codes, class_values = pd.factorize(df[column], sort=True)
+        counts = np.bincount(codes[codes >= 0], minlength=len(class_values))
 
-            if n_to_add > 0:
-                print(f"  {class_value}: {n_samples} → {target_samples_per_class} "
-                      f"(adding {n_to_add} duplicates)")
+        # Row positions of each class, in original order, without building sub-frames
+        order = np.argsort(codes, kind='stable')
+        order = order[codes[order] >= 0]
+        class_rows = np.split(order, np.cumsum(counts)[:-1])
 
-                # Keep original samples
-                balanced_dfs.append(group)
+        # Output rows as source positions, plus their duplicate number (-1 for originals)
+        positions = [np.empty(0, dtype=np.intp)]
+        dup_numbers = [np.empty(0, dtype=np.intp)]
 
-                # Add duplicates with modified filenames
-                duplicates_added = 0
-                while duplicates_added < n_to_add:
-                    # Cycle through samples
-                    idx = duplicates_added % n_samples
-                    sample = group.iloc[idx:idx+1].copy()
+        for class_value, rows, n_samples in zip(class_values, class_rows, counts):
+            n_to_add = target_samples_per_class - n_samples
 
-                    # Modify filename to avoid conflicts
-                    original_filename = sample['filename'].values[0]
-                    stem = Path(original_filename).stem
-                    suffix = Path(original_filename).suffix
-                    new_filename = f"{stem}_dup{duplicates_added}{suffix}"
-                    sample.loc[:, 'filename'] = new_filename
+            if n_to_add > 0:
+                logger.info(f"  {class_value}: {n_samples} → {target_samples_per_class} "
+                            f"(adding {n_to_add} duplicates)")
 
-                    balanced_dfs.append(sample)
-                    duplicates_added += 1
+                # Keep original samples, then cycle through them for duplicates
+                positions += [rows, rows[np.arange(n_to_add) % n_samples]]
+                dup_numbers += [np.full(n_samples, -1), np.arange(n_to_add)]
 
             else:
                 if keep_above_target:
-                    print(f"  {class_value}: {n_samples} (already >= target, keeping all)")
-                    balanced_dfs.append(group)
+                    logger.info(f"  {class_value}: {n_samples} (already >= target, keeping all)")
+                    kept = rows
                 else:
-                    print(f"  {class_value}: {n_samples} → {target_samples_per_class} "
-                          f"(downsampling)")
-                    balanced_dfs.append(group.iloc[:target_samples_per_class])
+                    logger.info(f"  {class_value}: {n_samples} → {target_samples_per_class} "
+                                f"(downsampling)")
+                    kept = rows[:target_samples_per_class]
 
-        df_balanced = pd.concat(balanced_dfs, ignore_index=True)
+                positions.append(kept)
+                dup_numbers.append(np.full(len(kept), -1))
 
-        print(f"\n✓ Dataset balanced! Total samples: {len(df_balanced)}")
+        positions = np.concatenate(positions)
+        dup_numbers = np.concatenate(dup_numbers)
+        is_dup = dup_numbers >= 0
+
+        # Final row count is known up front: gather every row in one iloc call
+        df_balanced = df.iloc[positions].reset_index(drop=True)
+        df_balanced['orig_filename'] = df_balanced['filename']
+
+        # Rename duplicates to avoid conflicts (vectorized stem/suffix split)
+        parts = df['filename'].str.extract(r'^(.*?)(\.[^.]*)?$')
+        stems = parts[0].to_numpy(dtype=object)
+        suffixes = parts[1].fillna('').to_numpy(dtype=object)
+        dup_sources = positions[is_dup]
+
+        filenames = df_balanced['filename'].to_numpy(dtype=object, copy=True)
+        filenames[is_dup] = (
+            stems[dup_sources] + '_dup' + dup_numbers[is_dup].astype(str).astype(object) + suffixes[dup_sources]
+        )
+        df_balanced['filename'] = pd.array(filenames, dtype=df['filename'].dtype)
+
+        logger.info(f"\n✓ Dataset balanced! Total samples: {len(df_balanced)}")
 
         return df_balanced
 
@@ -97,7 +116,12 @@ class DataBalancer:
         return df[column].value_counts().sort_index()
 
     @staticmethod
-    def print_distribution(df: pd.DataFrame, column: str, title: str = "Distribution"):
+    def print_distribution(
+        df: pd.DataFrame,
+        column: str,
+        title: str = "Distribution",
+        counts: Optional[pd.Series] = None
+    ):
         """
         Print class distribution.
 
@@ -105,12 +129,14 @@ class DataBalancer:
             df: DataFrame
             column: Column to analyze
             title: Title for the output
+            counts: Precomputed class distribution of df (computed if None)
         """
-        print(f"\n{title}:")
+        logger.info(f"\n{title}:")
 
-        counts = DataBalancer.get_class_distribution(df, column)
+        if counts is None:
+            counts = DataBalancer.get_class_distribution(df, column)
         for label, count in counts.items():
             percentage = (count / len(df)) * 100
-            print(f"  {label:12}: {count:5} samples ({percentage:5.1f}%)")
+            logger.info(f"  {label:12}: {count:5} samples ({percentage:5.1f}%)")
 
-        print(f"\n  Total training: {len(df)} samples")
+        logger.info(f"\n  Total training: {len(df)} samples")
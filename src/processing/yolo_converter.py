@@ -3,12 +3,43 @@ YOLO Converter
 Converts data to YOLO format and exports to filesystem.
 """
 
+import logging
+import os
 import shutil
 import yaml
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Tuple
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, NumPy handles all sizes without it
+    njit = None
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeDumper as _YamlDumper
+
+logger = logging.getLogger(__name__)
+
+# Below this many boxes the NumPy expression is already fast enough
+_NUMBA_MIN_ROWS = 100_000
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _yolo_bbox_kernel(xmin, xmax, ymin, ymax, width, height,
+                          out_xc, out_yc, out_bw, out_bh):
+        """Fused, multithreaded YOLO bbox conversion (same arithmetic as NumPy)."""
+        for i in prange(xmin.shape[0]):
+            out_xc[i] = (xmin[i] + xmax[i]) / 2 / width[i]
+            out_yc[i] = (ymin[i] + ymax[i]) / 2 / height[i]
+            out_bw[i] = (xmax[i] - xmin[i]) / width[i]
+            out_bh[i] = (ymax[i] - ymin[i]) / height[i]
+
 
 class YOLOConverter:
     """Converts and exports data to YOLO format."""
@@ -31,6 +62,39 @@ class YOLOConverter:
 
         return x_center, y_center, bbox_width, bbox_height
 
+    @staticmethod
+    def convert_bboxes_to_yolo_vectorized(
+        df: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert all bounding boxes of a DataFrame to YOLO format at once.
+
+        Args:
+            df: DataFrame with xmin, xmax, ymin, ymax, width, height columns
+
+        Returns:
+            Tuple of arrays (x_center, y_center, bbox_width, bbox_height) in normalized coords
+        """
+        xmin = df['xmin'].to_numpy(dtype=np.float64)
+        xmax = df['xmax'].to_numpy(dtype=np.float64)
+        ymin = df['ymin'].to_numpy(dtype=np.float64)
+        ymax = df['ymax'].to_numpy(dtype=np.float64)
+        width = df['width'].to_numpy(dtype=np.float64)
+        height = df['height'].to_numpy(dtype=np.float64)
+
+        # Very large tables: one fused parallel pass instead of NumPy temporaries
+        if njit is not None and len(xmin) >= _NUMBA_MIN_ROWS:
+            outputs = tuple(np.empty_like(xmin) for _ in range(4))
+            _yolo_bbox_kernel(xmin, xmax, ymin, ymax, width, height, *outputs)
+            return outputs
+
+        x_center = (xmin + xmax) / 2 / width
+        y_center = (ymin + ymax) / 2 / height
+        bbox_width = (xmax - xmin) / width
+        bbox_height = (ymax - ymin) / height
+
+        return x_center, y_center, bbox_width, bbox_height
+
     @staticmethod
     def export_to_yolo(
         df: pd.DataFrame,
@@ -38,22 +102,29 @@ class YOLOConverter:
         output_images_dir: Path,
         output_labels_dir: Path,
         class_mapping: Dict[str, int],
-        class_column: str = 'class'
+        class_column: str = 'class',
+        link_mode: str = 'copy'
     ) -> Tuple[int, int]:
         """
         Export dataset to YOLO format.
 
         Args:
-            df: DataFrame with image annotations
+            df: DataFrame with image annotations (an optional 'orig_filename'
+                column names the source image of duplicated rows)
             source_images_dir: Source directory containing original images
             output_images_dir: Output directory for images
             output_labels_dir: Output directory for labels
             class_mapping: Dictionary mapping class names to indices
             class_column: Column name containing class labels
+            link_mode: How images are placed in the output directory: 'copy',
+                'hardlink' (falls back to copying across filesystems) or 'symlink'
 
         Returns:
             Tuple of (exported_count, skipped_count)
         """
+        if link_mode not in ('copy', 'hardlink', 'symlink'):
+            raise ValueError(f"Unknown link mode: {link_mode}")
+
         exported = 0
         skipped = 0
 
@@ -65,40 +136,101 @@ class YOLOConverter:
         output_images_dir.mkdir(parents=True, exist_ok=True)
         output_labels_dir.mkdir(parents=True, exist_ok=True)
 
-        for filename, group in df.groupby("filename"):
-            try:
-                # Check if this is a duplicate (has _dup in name)
-                if '_dup' in filename:
-                    # Get original filename
-                    original_filename = filename.split('_dup')[0] + Path(filename).suffix
-                    src = source_images_dir / original_filename
-                else:
-                    src = source_images_dir / filename
+        # Stable sort keeps each file's boxes in order and contiguous, so the
+        # groupby below can take groups in encounter order without re-sorting keys
+        df = df.sort_values('filename', kind='stable', ignore_index=True)
 
-                if not src.exists():
-                    skipped += 1
-                    continue
+        # Class indices for every box in one vectorized lookup (-1 for unknown classes);
+        # the sorted frame is a private copy, so the column can be added in place
+        df['_cls_idx'] = (
+            df[class_column].map(class_mapping).astype('float64').fillna(-1).astype(np.int32)
+        )
+
+        # Parse every filename once, vectorized, for the label file stems
+        filenames = pd.Series(df['filename'].unique())
+        stem_map = dict(zip(filenames, filenames.str.rsplit('.', n=1).str[0]))
+
+        # Balanced data records the image each (possibly duplicated) row comes from
+        has_orig_filename = 'orig_filename' in df.columns
+
+        def export_one(filename: str, group: pd.DataFrame) -> bool:
+            """Copy one image and write its label file; False if the source is missing."""
+            src = source_images_dir / (group['orig_filename'].iat[0] if has_orig_filename else filename)
+
+            if not src.exists():
+                return False
+
+            dst = output_images_dir / filename
+            YOLOConverter._place_image(src, dst, link_mode)
 
-                # Copy image
-                dst = output_images_dir / filename
-                shutil.copy2(src, dst)
+            # Create label file
+            label_file = output_labels_dir / (stem_map[filename] + ".txt")
+            cls_idx = group['_cls_idx'].to_numpy()
+            if (cls_idx < 0).any():
+                raise KeyError(group[class_column].iat[int(np.argmin(cls_idx))])
+            x_c, y_c, w, h = YOLOConverter.convert_bboxes_to_yolo_vectorized(group)
+            lines = "".join(
+                f"{c} {x:.6f} {y:.6f} {bw:.6f} {bh:.6f}\n"
+                for c, x, y, bw, bh in zip(cls_idx, x_c, y_c, w, h)
+            )
 
-                # Create label file
-                label_file = output_labels_dir / (Path(filename).stem + ".txt")
-                with open(label_file, "w") as f:
-                    for _, row in group.iterrows():
-                        cls_idx = class_mapping[row[class_column]]
-                        x_c, y_c, w, h = YOLOConverter.convert_bbox_to_yolo(row)
-                        f.write(f"{cls_idx} {x_c:.6f} {y_c:.6f} {w:.6f} {h:.6f}\n")
+            # One binary write per label file, bypassing the text-mode encoder
+            label_file.write_bytes(lines.encode())
 
-                exported += 1
+            return True
 
-            except Exception as e:
-                print(f"Error processing {filename}: {e}")
-                skipped += 1
+        # Images are independent and file I/O releases the GIL, so copy in parallel
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+            futures = {
+                filename: executor.submit(export_one, filename, group)
+                for filename, group in df.groupby("filename", sort=False, observed=True)
+            }
+
+            for filename, future in futures.items():
+                try:
+                    if future.result():
+                        exported += 1
+                    else:
+                        skipped += 1
+
+                except Exception as e:
+                    logger.error(f"Error processing {filename}: {e}")
+                    skipped += 1
 
         return exported, skipped
 
+    @staticmethod
+    def _place_image(src: Path, dst: Path, link_mode: str):
+        """
+        Place an image in the output directory by copying or linking it.
+
+        Links avoid duplicating image bytes; every duplicate of an image
+        hardlinks to the same inode.
+
+        Args:
+            src: Source image path
+            dst: Destination image path
+            link_mode: One of 'copy', 'hardlink' or 'symlink'
+        """
+        # Clear leftovers from a previous export: links cannot overwrite, and a
+        # copy onto an earlier link would write through to the source image
+        dst.unlink(missing_ok=True)
+
+        if link_mode != 'copy':
+            try:
+                if link_mode == 'hardlink':
+                    os.link(src, dst)
+                else:
+                    os.symlink(src.resolve(), dst)
+                return
+            except OSError:
+                # e.g. source and output on different filesystems
+                if link_mode == 'symlink':
+                    raise
+
+        # Copy image contents only (no metadata, single sendfile on Linux)
+        shutil.copyfile(src, dst)
+
     @staticmethod
     def create_yaml_config(
         output_dir: Path,
@@ -125,15 +257,20 @@ class YOLOConverter:
             'train': train_subdir,
             'val': val_subdir,
             'nc': len(class_mapping),
-            'names': {idx: name for name, idx in class_mapping.items()}
+            # Safe dumpers only know Python scalars, unwrap any NumPy ones
+            'names': {
+                int(idx): name.item() if isinstance(name, np.generic) else name
+                for name, idx in class_mapping.items()
+            }
         }
 
         yaml_path = output_dir / 'dataset.yaml'
         with open(yaml_path, 'w') as f:
-            yaml.dump(yaml_content, f, default_flow_style=False, sort_keys=False)
+            # LibYAML's C emitter when available
+            yaml.dump(yaml_content, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
 
-        print(f"\n✓ YAML configuration created: {yaml_path}")
-        print(f"  Classes: {len(class_mapping)}")
+        logger.info(f"\n✓ YAML configuration created: {yaml_path}")
+        logger.info(f"  Classes: {len(class_mapping)}")
 
         return yaml_path
 
@@ -149,12 +286,16 @@ class YOLOConverter:
         Returns:
             Dictionary mapping class names to indices
         """
-        unique_classes = sorted(df[column].unique())
+        # One counting pass gives both the classes and their sizes;
+        # categorical columns also report unused categories, with a zero count
+        counts = df[column].value_counts()
+        counts = counts[counts > 0].to_dict()
+
+        unique_classes = sorted(counts)
         class_mapping = {cls: idx for idx, cls in enumerate(unique_classes)}
 
-        print(f"\nClass mapping created ({len(class_mapping)} classes):")
+        logger.info(f"\nClass mapping created ({len(class_mapping)} classes):")
         for cls, idx in class_mapping.items():
-            count = len(df[df[column] == cls])
-            print(f"  {idx}: {cls} ({count} samples)")
+            logger.info(f"  {idx}: {cls} ({counts[cls]} samples)")
 
         return class_mapping
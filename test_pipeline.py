@@ -2,9 +2,14 @@
 Test script for the pipeline - Step by step testing
 """
 
+import logging
+
 from src.config import PipelineConfig
 from src.pipelines import BinaryPipeline, SpeciesPipeline, DiseasePipeline
 
+# Pipelines report progress through logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+
 
 def test_config():
     """Test 1: Configuration loading"""